@@ -4,16 +4,33 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from log_utils import log
 from trend_analysis import build_trend_data
 
 
+@lru_cache(maxsize=256)
+def _load_json_cached(path_str: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    data = Path(path_str).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def _load_json(path: Path) -> dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    stat = path.stat()
+    return _load_json_cached(str(path), stat.st_mtime_ns, stat.st_size)
 
 
 def _extract_labels(runs: list[dict[str, Any]]) -> list[str]:
@@ -35,10 +52,28 @@ def _format_axis_label(label: str, limit: int = 26) -> str:
     return text[: limit - 1].rstrip() + "…"
 
 
+def _content_key(payload: Any) -> str:
+    serialized = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.blake2b(serialized.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _chart_is_current(path: Path, content_key: str) -> bool:
+    hash_path = path.with_suffix(".hash")
+    try:
+        return path.exists() and hash_path.read_text(encoding="utf-8").strip() == content_key
+    except OSError:
+        return False
+
+
+def _write_chart_hash(path: Path, content_key: str) -> None:
+    path.with_suffix(".hash").write_text(content_key + "\n", encoding="utf-8")
+
+
 def _save_chart(fig: Any, path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     fig.tight_layout()
-    fig.savefig(path, dpi=120)
+    # Charts are transient dashboard assets, so favor encoder speed over PNG size.
+    fig.savefig(path, dpi=120, pil_kwargs={"compress_level": 1, "optimize": False})
     fig.clf()
 
 
@@ -51,19 +86,21 @@ def generate_score_trend_line_chart(
         log("No runs in trend data; skipping score trend chart")
         return ""
 
-    try:
-        import matplotlib
+    labels = _extract_labels(runs)
+    values = [float(run.get("average_score") or 0.0) for run in runs]
 
-        matplotlib.use("Agg")
-        import matplotlib.pyplot as plt
+    output_path = charts_dir / "score_trend.png"
+    content_key = _content_key([labels, values])
+    if _chart_is_current(output_path, content_key):
+        return _to_markdown_image(output_path, "Score Trend")
+
+    try:
+        from matplotlib.figure import Figure
     except Exception as exc:
         log(f"matplotlib not available; skipping chart generation: {exc}")
         return ""
 
-    labels = _extract_labels(runs)
-    values = [float(run.get("average_score") or 0.0) for run in runs]
-
-    fig = plt.figure(figsize=(10, 4))
+    fig = Figure(figsize=(10, 4))
     ax = fig.add_subplot(1, 1, 1)
     ax.plot(labels, values, marker="o")
     ax.set_title("Average Opportunity Score Trend")
@@ -71,9 +108,8 @@ def generate_score_trend_line_chart(
     ax.set_ylabel("Average Score")
     ax.tick_params(axis="x", labelrotation=45)
 
-    output_path = charts_dir / "score_trend.png"
     _save_chart(fig, output_path)
-    plt.close(fig)
+    _write_chart_hash(output_path, content_key)
     return _to_markdown_image(output_path, "Score Trend")
 
 
@@ -86,19 +122,21 @@ def generate_theme_count_line_chart(
         log("No runs in trend data; skipping theme count chart")
         return ""
 
-    try:
-        import matplotlib
+    labels = _extract_labels(runs)
+    values = [int(run.get("theme_count") or 0) for run in runs]
 
-        matplotlib.use("Agg")
-        import matplotlib.pyplot as plt
+    output_path = charts_dir / "theme_count_trend.png"
+    content_key = _content_key([labels, values])
+    if _chart_is_current(output_path, content_key):
+        return _to_markdown_image(output_path, "Theme Count Trend")
+
+    try:
+        from matplotlib.figure import Figure
     except Exception as exc:
         log(f"matplotlib not available; skipping theme count chart: {exc}")
         return ""
 
-    labels = _extract_labels(runs)
-    values = [int(run.get("theme_count") or 0) for run in runs]
-
-    fig = plt.figure(figsize=(10, 4))
+    fig = Figure(figsize=(10, 4))
     ax = fig.add_subplot(1, 1, 1)
     ax.plot(labels, values, marker="o")
     ax.set_title("Theme Count Trend")
@@ -106,9 +144,8 @@ def generate_theme_count_line_chart(
     ax.set_ylabel("Theme Count")
     ax.tick_params(axis="x", labelrotation=45)
 
-    output_path = charts_dir / "theme_count_trend.png"
     _save_chart(fig, output_path)
-    plt.close(fig)
+    _write_chart_hash(output_path, content_key)
     return _to_markdown_image(output_path, "Theme Count Trend")
 
 
@@ -122,23 +159,19 @@ def generate_partner_stacked_bar_chart(
         log("No runs in trend data; skipping partner stacked bar chart")
         return ""
 
-    try:
-        import matplotlib
-
-        matplotlib.use("Agg")
-        import matplotlib.pyplot as plt
-    except Exception as exc:
-        log(f"matplotlib not available; skipping partner chart: {exc}")
-        return ""
-
+    # Single pass over runs: normalize each run's partner counts once, then
+    # both the totals and the per-partner series reuse the normalized rows.
+    run_partner_counts: list[dict[str, int]] = []
     partner_totals: dict[str, int] = {}
     for run in runs:
         partner_counts = run.get("per_partner_counts")
         if not isinstance(partner_counts, dict):
+            run_partner_counts.append({})
             continue
-        for partner, count in partner_counts.items():
-            partner_name = str(partner)
-            partner_totals[partner_name] = partner_totals.get(partner_name, 0) + int(count or 0)
+        normalized = {str(partner): int(count or 0) for partner, count in partner_counts.items()}
+        run_partner_counts.append(normalized)
+        for partner_name, count in normalized.items():
+            partner_totals[partner_name] = partner_totals.get(partner_name, 0) + count
 
     if not partner_totals:
         log("No partner fields found in trend data; skipping partner stacked bar chart")
@@ -149,15 +182,24 @@ def generate_partner_stacked_bar_chart(
     ]
     labels = _extract_labels(runs)
 
-    fig = plt.figure(figsize=(11, 4.5))
+    output_path = charts_dir / "partner_stacked_trend.png"
+    series = {partner: [counts.get(partner, 0) for counts in run_partner_counts] for partner in selected_partners}
+    content_key = _content_key([labels, series])
+    if _chart_is_current(output_path, content_key):
+        return _to_markdown_image(output_path, "Partner Trend")
+
+    try:
+        from matplotlib.figure import Figure
+    except Exception as exc:
+        log(f"matplotlib not available; skipping partner chart: {exc}")
+        return ""
+
+    fig = Figure(figsize=(11, 4.5))
     ax = fig.add_subplot(1, 1, 1)
     bottoms = [0] * len(runs)
 
     for partner in selected_partners:
-        values = []
-        for run in runs:
-            partner_counts = run.get("per_partner_counts") if isinstance(run.get("per_partner_counts"), dict) else {}
-            values.append(int(partner_counts.get(partner, 0) or 0))
+        values = series[partner]
         ax.bar(labels, values, bottom=bottoms, label=partner)
         bottoms = [bottoms[index] + values[index] for index in range(len(values))]
 
@@ -167,9 +209,8 @@ def generate_partner_stacked_bar_chart(
     ax.tick_params(axis="x", labelrotation=45)
     ax.legend(loc="upper left", bbox_to_anchor=(1.01, 1.0), borderaxespad=0)
 
-    output_path = charts_dir / "partner_stacked_trend.png"
     _save_chart(fig, output_path)
-    plt.close(fig)
+    _write_chart_hash(output_path, content_key)
     return _to_markdown_image(output_path, "Partner Trend")
 
 
@@ -271,12 +312,14 @@ def generate_partner_by_theme_stacked_bar_chart(
         log(f"matplotlib not available; skipping partner-by-theme chart: {exc}")
         return ""
 
+    point_partner_counts: list[dict[str, int]] = []
     partner_totals: dict[str, int] = {}
     for point in run_points:
         partner_counts = point.get("partner_counts") if isinstance(point.get("partner_counts"), dict) else {}
-        for partner, count in partner_counts.items():
-            partner_name = str(partner)
-            partner_totals[partner_name] = partner_totals.get(partner_name, 0) + int(count or 0)
+        normalized = {str(partner): int(count or 0) for partner, count in partner_counts.items()}
+        point_partner_counts.append(normalized)
+        for partner_name, count in normalized.items():
+            partner_totals[partner_name] = partner_totals.get(partner_name, 0) + count
 
     if not partner_totals:
         log(f"No partner counts for theme '{theme_label}'; skipping partner-by-theme chart")
@@ -292,10 +335,7 @@ def generate_partner_by_theme_stacked_bar_chart(
     bottoms = [0] * len(run_points)
 
     for partner in selected_partners:
-        values = []
-        for point in run_points:
-            partner_counts = point.get("partner_counts") if isinstance(point.get("partner_counts"), dict) else {}
-            values.append(int(partner_counts.get(partner, 0) or 0))
+        values = [counts.get(partner, 0) for counts in point_partner_counts]
         ax.bar(labels, values, bottom=bottoms, label=partner)
         bottoms = [bottoms[index] + values[index] for index in range(len(values))]
 
@@ -546,11 +586,18 @@ def generate_trend_charts(
     trend_data: dict[str, Any],
     charts_dir: Path = Path("docs/charts"),
 ) -> str:
-    charts = [
-        generate_score_trend_line_chart(trend_data=trend_data, charts_dir=charts_dir),
-        generate_theme_count_line_chart(trend_data=trend_data, charts_dir=charts_dir),
-        generate_partner_stacked_bar_chart(trend_data=trend_data, charts_dir=charts_dir),
-    ]
+    generators = (
+        generate_score_trend_line_chart,
+        generate_theme_count_line_chart,
+        generate_partner_stacked_bar_chart,
+    )
+    # Each generator builds its own Figure (no shared pyplot state), so the
+    # three renders can rasterize and encode concurrently.
+    with ThreadPoolExecutor(max_workers=len(generators)) as executor:
+        futures = [
+            executor.submit(generator, trend_data=trend_data, charts_dir=charts_dir) for generator in generators
+        ]
+        charts = [future.result() for future in futures]
     valid = [chart for chart in charts if chart]
     return "\n\n".join(valid)
 
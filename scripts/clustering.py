@@ -95,6 +95,17 @@ def _hashing_embedding(text: str, dim: int = EMBEDDING_DIM) -> list[float]:
     return vector
 
 
+_SESSION: requests.Session | None = None
+
+
+def _session() -> requests.Session:
+    """Return a shared Session so repeated embedding calls reuse one connection."""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = requests.Session()
+    return _SESSION
+
+
 def embed_text(text: str) -> list[float]:
     """Embed text with OpenAI embeddings API and hash fallback on failure."""
     api_key = (os.environ.get("AI_API_KEY") or os.environ.get("OPENAI_API_KEY") or "").strip()
@@ -108,7 +119,7 @@ def embed_text(text: str) -> list[float]:
     payload = {"model": EMBEDDING_MODEL, "input": text or ""}
 
     try:
-        response = requests.post(
+        response = _session().post(
             "https://api.openai.com/v1/embeddings",
             headers=headers,
             json=payload,
@@ -166,7 +177,29 @@ def _run_kmeans(vectors: list[list[float]], k: int, max_iters: int = 20) -> list
         changed = False
 
         for idx, vector in enumerate(vectors):
-            best_cluster = min(range(k), key=lambda cluster_idx: _l2_distance(vector, centroids[cluster_idx]))
+            # Squared distance is monotonic in true distance, so the sqrt and
+            # the per-candidate lambda calls of min() are both unnecessary.
+            # Scoring the previous assignment first gives a tight bound that
+            # lets the partial-sum check below abandon most candidates early.
+            previous_cluster = assignments[idx]
+            best_cluster = previous_cluster
+            best_distance = 0.0
+            for a, b in zip(vector, centroids[previous_cluster]):
+                diff = a - b
+                best_distance += diff * diff
+            for cluster_idx in range(k):
+                if cluster_idx == previous_cluster:
+                    continue
+                centroid = centroids[cluster_idx]
+                distance = 0.0
+                for a, b in zip(vector, centroid):
+                    diff = a - b
+                    distance += diff * diff
+                    if distance >= best_distance:
+                        break
+                if distance < best_distance:
+                    best_distance = distance
+                    best_cluster = cluster_idx
             if assignments[idx] != best_cluster:
                 assignments[idx] = best_cluster
                 changed = True
@@ -186,12 +219,13 @@ def _run_kmeans(vectors: list[list[float]], k: int, max_iters: int = 20) -> list
 
 
 def _cluster_keywords(texts: list[str], max_keywords: int = 5) -> list[str]:
-    counter: Counter[str] = Counter()
-    for text in texts:
-        for token in _tokenize(text):
-            if token in _STOPWORDS or len(token) < 3:
-                continue
-            counter[token] += 1
+    # One regex scan over the joined texts beats a scan per text; tokens
+    # cannot span the "\n" separator because the token pattern excludes it.
+    blob = "\n".join(texts)
+    counter = Counter(match.group(0).lower() for match in _TOKEN_RE.finditer(blob))
+    for token in list(counter):
+        if token in _STOPWORDS or len(token) < 3:
+            del counter[token]
     return [token for token, _ in counter.most_common(max_keywords)]
 
 
@@ -220,13 +254,9 @@ def cluster_opportunities(opps: list[dict[str, Any]], num_clusters: int = 5) ->
         keywords = _cluster_keywords(cluster_texts)
         label = ", ".join(keywords[:4]) if keywords else f"Cluster {cluster_id}"
 
-        opportunities: list[dict[str, Any]] = []
-        for idx in member_indices:
-            enriched = dict(valid_opps[idx])
-            enriched["cluster_id"] = cluster_id
-            enriched["cluster_label"] = label
-            opportunities.append(enriched)
-
+        opportunities = [
+            {**valid_opps[idx], "cluster_id": cluster_id, "cluster_label": label} for idx in member_indices
+        ]
         opportunities.sort(key=lambda item: float(item.get("score", 0.0)), reverse=True)
         clusters.append({"id": cluster_id, "label": label, "opportunities": opportunities})
 
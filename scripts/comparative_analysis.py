@@ -4,17 +4,41 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import operator
+import os
 import re
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from log_utils import log
 
 
 def _load_json(path: Path) -> dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# C-implemented sort key for decorate-sort lists of (key_tuple, row) pairs;
+# the key tuple is computed once per row instead of once per comparison.
+_FIRST = operator.itemgetter(0)
+
+
+def _sorted_rows(keyed: list[tuple[tuple[Any, ...], dict[str, Any]]]) -> list[dict[str, Any]]:
+    keyed.sort(key=_FIRST)
+    return [row for _, row in keyed]
 
 
 def _safe_float(value: Any) -> float:
@@ -37,6 +61,11 @@ def _extract_run_id(payload: dict[str, Any], file_path: Path) -> str:
     return stem
 
 
+# Covers the "YYYYMMDD-HHMMSS", "YYYYMMDDHHMMSS" and "YYYY-MM-DD" run-id
+# shapes in one match, so the common path pays no strptime ValueError churn.
+_RUN_ID_RE = re.compile(r"^(\d{4})-?(\d{2})-?(\d{2})(?:[-T]?(\d{2})(\d{2})(\d{2}))?$")
+
+
 def _parse_run_datetime(payload: dict[str, Any], file_path: Path) -> datetime:
     generated_utc = str(payload.get("generated_utc") or "").strip()
     if generated_utc:
@@ -45,23 +74,36 @@ def _parse_run_datetime(payload: dict[str, Any], file_path: Path) -> datetime:
         except ValueError:
             pass
 
-    run_id = _extract_run_id(payload, file_path)
-    for fmt in ("%Y%m%d-%H%M%S", "%Y%m%d%H%M%S", "%Y-%m-%d"):
+    match = _RUN_ID_RE.match(_extract_run_id(payload, file_path))
+    if match:
         try:
-            return datetime.strptime(run_id, fmt)
+            return datetime(*(int(group or 0) for group in match.groups()))
         except ValueError:
-            continue
+            pass
 
     return datetime.utcfromtimestamp(file_path.stat().st_mtime)
 
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_DASH_RE = re.compile(r"-+")
+# Maps every non-alphanumeric ASCII character to "-" in a single C-level pass.
+_SLUG_TRANSLATION = str.maketrans({char: "-" for char in map(chr, range(128)) if not char.isalnum()})
+
+
 def _slugify(value: str) -> str:
     lowered = value.strip().lower()
-    return re.sub(r"[^a-z0-9]+", "-", lowered).strip("-") or "uncategorized"
+    if lowered.isascii():
+        return _DASH_RE.sub("-", lowered.translate(_SLUG_TRANSLATION)).strip("-") or "uncategorized"
+    return _SLUG_RE.sub("-", lowered).strip("-") or "uncategorized"
+
+
+_PARTNER_KEYS = ("partner", "partner_name", "organization", "org", "company", "client")
+_THEME_KEYS = ("cluster_label", "theme", "category")
+_SCORE_KEYS = ("opportunity", "overall", "priority", "score")
 
 
 def _extract_partner(opportunity: dict[str, Any]) -> str:
-    for key in ("partner", "partner_name", "organization", "org", "company", "client"):
+    for key in _PARTNER_KEYS:
         raw = opportunity.get(key)
         if isinstance(raw, str) and raw.strip():
             return raw.strip()
@@ -69,7 +111,7 @@ def _extract_partner(opportunity: dict[str, Any]) -> str:
 
 
 def _extract_theme(opportunity: dict[str, Any], fallback_theme: str | None = None) -> str:
-    for key in ("cluster_label", "theme", "category"):
+    for key in _THEME_KEYS:
         raw = opportunity.get(key)
         if isinstance(raw, str) and raw.strip():
             return raw.strip()
@@ -92,12 +134,26 @@ def _extract_score(opportunity: dict[str, Any]) -> float:
 
     scores = opportunity.get("scores")
     if isinstance(scores, dict):
-        for key in ("opportunity", "overall", "priority", "score"):
+        for key in _SCORE_KEYS:
             if key in scores:
                 return _safe_float(scores.get(key))
     return 0.0
 
 
+def _extract_partner_theme_score(opportunity: dict[str, Any]) -> tuple[str, str, float]:
+    """Extract all three axes in one pass, interning the axis labels.
+
+    Runs contain thousands of opportunities but only a few dozen distinct
+    partner/theme strings; sys.intern lets the matrix dict inserts hit the
+    identity-compare fast path.
+    """
+    return (
+        sys.intern(_extract_partner(opportunity)),
+        sys.intern(_extract_theme(opportunity)),
+        _extract_score(opportunity),
+    )
+
+
 def _extract_opportunities(payload: dict[str, Any]) -> list[dict[str, Any]]:
     ranked = payload.get("ranked_opportunities")
     if isinstance(ranked, list):
@@ -132,29 +188,142 @@ def _extract_opportunities(payload: dict[str, Any]) -> list[dict[str, Any]]:
     return []
 
 
+# Cached per-file metadata so unchanged analyses are not re-parsed every run.
+_CACHE_FILENAME = ".comparative_cache.json"
+
+
+def _load_metadata_cache(analyses_dir: Path) -> dict[str, Any]:
+    cache_path = analyses_dir / _CACHE_FILENAME
+    try:
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    return cached if isinstance(cached, dict) else {}
+
+
+def _write_metadata_cache(analyses_dir: Path, cache: dict[str, Any]) -> None:
+    cache_path = analyses_dir / _CACHE_FILENAME
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        tmp_path.write_text(json.dumps(cache), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError as exc:
+        log(f"Could not persist comparative metadata cache: {exc}")
+
+
+def _record_payload(record: dict[str, Any]) -> dict[str, Any]:
+    """Return the record's analysis payload, loading it lazily for cache hits."""
+    if record.get("analysis") is None:
+        try:
+            record["analysis"] = _load_json(record["file_path"])
+        except Exception as exc:
+            log(f"Could not load analysis payload {record['file_path']}: {exc}")
+            record["analysis"] = {}
+    return record["analysis"]
+
+
+def _record_summary(analyses_dir: Path, record: dict[str, Any]) -> dict[str, Any]:
+    """Return the run's summary matrices, reusing cached ones for unchanged files.
+
+    load_analysis_runs leaves ``analysis`` unset only when the file's stat
+    matched the metadata cache, so a cached summary is trustworthy exactly in
+    that case; otherwise the run is summarized fresh and the matrices are
+    persisted for the next invocation.
+    """
+    cache = _load_metadata_cache(analyses_dir)
+    entry = cache.get(str(record["file_path"]))
+    if record.get("analysis") is None and isinstance(entry, dict) and isinstance(entry.get("summary"), dict):
+        summary = entry["summary"]
+        return {
+            "run_id": record["run_id"],
+            "opportunities": [],
+            "counts": summary.get("counts") or {},
+            "average_scores": summary.get("average_scores") or {},
+        }
+
+    summary = _summarize_run(_record_payload(record), record["run_id"])
+    if isinstance(entry, dict):
+        entry["summary"] = {"counts": summary["counts"], "average_scores": summary["average_scores"]}
+        _write_metadata_cache(analyses_dir, cache)
+    return summary
+
+
+def _parse_analysis_file(file_path: Path) -> dict[str, Any] | None:
+    """Parse one analysis file into a run record, or None if unreadable."""
+    try:
+        payload = _load_json(file_path)
+    except Exception as exc:
+        log(f"Skipping unreadable analysis file {file_path}: {exc}")
+        return None
+    return {
+        "file_path": file_path,
+        "analysis": payload,
+        "run_id": _extract_run_id(payload, file_path),
+        "run_datetime": _parse_run_datetime(payload, file_path),
+    }
+
+
 def load_analysis_runs(analyses_dir: Path = Path("analyses")) -> list[dict[str, Any]]:
     files = list(analyses_dir.glob("analysis-*.json")) + list(analyses_dir.glob("weekly-*.json"))
     seen_paths: set[Path] = set()
     records: list[dict[str, Any]] = []
+    misses: list[tuple[Path, os.stat_result]] = []
+    cache = _load_metadata_cache(analyses_dir)
+    fresh_cache: dict[str, Any] = {}
 
     for file_path in files:
         if file_path in seen_paths:
             continue
         seen_paths.add(file_path)
+
         try:
-            payload = _load_json(file_path)
-        except Exception as exc:
+            stat = file_path.stat()
+        except OSError as exc:
             log(f"Skipping unreadable analysis file {file_path}: {exc}")
             continue
 
-        records.append(
-            {
-                "file_path": file_path,
-                "analysis": payload,
-                "run_id": _extract_run_id(payload, file_path),
-                "run_datetime": _parse_run_datetime(payload, file_path),
+        cache_key = str(file_path)
+        entry = cache.get(cache_key)
+        if (
+            isinstance(entry, dict)
+            and entry.get("mtime_ns") == stat.st_mtime_ns
+            and entry.get("size") == stat.st_size
+        ):
+            # Unchanged file: reuse cached metadata and defer the payload
+            # parse until a caller actually needs it via _record_payload.
+            fresh_cache[cache_key] = entry
+            records.append(
+                {
+                    "file_path": file_path,
+                    "analysis": None,
+                    "run_id": str(entry.get("run_id") or file_path.stem),
+                    "run_datetime": datetime.fromisoformat(str(entry.get("run_datetime"))),
+                }
+            )
+            continue
+
+        misses.append((file_path, stat))
+
+    if misses:
+        # Read+decode of changed files overlaps across threads: the GIL is
+        # released during file IO and inside the C JSON scanner.
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(misses))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            parsed = list(executor.map(_parse_analysis_file, (path for path, _ in misses)))
+
+        for (file_path, stat), record in zip(misses, parsed):
+            if record is None:
+                continue
+            fresh_cache[str(file_path)] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "run_id": record["run_id"],
+                "run_datetime": record["run_datetime"].isoformat(),
             }
-        )
+            records.append(record)
+
+    if fresh_cache != cache:
+        _write_metadata_cache(analyses_dir, fresh_cache)
 
     records.sort(key=lambda record: (record["run_datetime"], record["run_id"]))
     return records
@@ -163,27 +332,28 @@ def load_analysis_runs(analyses_dir: Path = Path("analyses")) -> list[dict[str,
 def _summarize_run(payload: dict[str, Any], run_id: str) -> dict[str, Any]:
     opportunities = _extract_opportunities(payload)
 
-    matrix_counts: dict[str, dict[str, int]] = {}
-    matrix_scores_sum: dict[str, dict[str, float]] = {}
+    counts_acc: defaultdict[str, defaultdict[str, int]] = defaultdict(lambda: defaultdict(int))
+    scores_acc: defaultdict[str, defaultdict[str, float]] = defaultdict(lambda: defaultdict(float))
 
+    # Single fused pass; defaultdict makes each cell update one hash + one
+    # in-place increment instead of a get/reassign pair. Binding the row
+    # lookups to locals keeps the loop free of repeated attribute loads.
+    count_row_for = counts_acc.__getitem__
+    score_row_for = scores_acc.__getitem__
     for opportunity in opportunities:
-        partner = _extract_partner(opportunity)
-        theme = _extract_theme(opportunity)
-        score = _extract_score(opportunity)
-
-        matrix_counts.setdefault(partner, {})
-        matrix_scores_sum.setdefault(partner, {})
-
-        matrix_counts[partner][theme] = matrix_counts[partner].get(theme, 0) + 1
-        matrix_scores_sum[partner][theme] = matrix_scores_sum[partner].get(theme, 0.0) + score
-
-    matrix_average_scores: dict[str, dict[str, float]] = {}
-    for partner, theme_counts in matrix_counts.items():
-        matrix_average_scores[partner] = {}
-        for theme, count in theme_counts.items():
-            total_score = matrix_scores_sum.get(partner, {}).get(theme, 0.0)
-            avg_score = (total_score / count) if count else 0.0
-            matrix_average_scores[partner][theme] = round(avg_score, 4)
+        partner, theme, score = _extract_partner_theme_score(opportunity)
+        count_row_for(partner)[theme] += 1
+        score_row_for(partner)[theme] += score
+
+    # Convert back to plain dicts so JSON serialization is unchanged.
+    matrix_counts = {partner: dict(theme_counts) for partner, theme_counts in counts_acc.items()}
+    matrix_average_scores = {
+        partner: {
+            theme: round(scores_acc[partner][theme] / count, 4) if count else 0.0
+            for theme, count in theme_counts.items()
+        }
+        for partner, theme_counts in counts_acc.items()
+    }
 
     return {
         "run_id": run_id,
@@ -200,16 +370,19 @@ def _matrix_delta(
     themes: list[str],
     as_float: bool,
 ) -> dict[str, dict[str, Any]]:
+    # Callers pass densified numeric matrices (_summarize_run output padded
+    # with zeros), so plain subtraction per row replaces the per-cell
+    # _safe_float round trips.
     out: dict[str, dict[str, Any]] = {}
     for partner in partners:
-        out[partner] = {}
         current_row = current.get(partner) if isinstance(current.get(partner), dict) else {}
         previous_row = previous.get(partner) if isinstance(previous.get(partner), dict) else {}
-        for theme in themes:
-            current_value = current_row.get(theme, 0.0 if as_float else 0)
-            previous_value = previous_row.get(theme, 0.0 if as_float else 0)
-            delta = _safe_float(current_value) - _safe_float(previous_value)
-            out[partner][theme] = round(delta, 4) if as_float else int(delta)
+        if as_float:
+            out[partner] = {
+                theme: round(current_row.get(theme, 0.0) - previous_row.get(theme, 0.0), 4) for theme in themes
+            }
+        else:
+            out[partner] = {theme: current_row.get(theme, 0) - previous_row.get(theme, 0) for theme in themes}
     return out
 
 
@@ -221,74 +394,75 @@ def _build_partner_strengths(
     delta_counts: dict[str, dict[str, int]],
     delta_scores: dict[str, dict[str, float]],
 ) -> list[dict[str, Any]]:
-    theme_average_reference: dict[str, float] = {}
-    for theme in themes:
-        weighted_sum = 0.0
-        total_count = 0
-        for partner in partners:
-            count = int((counts.get(partner) or {}).get(theme, 0) or 0)
-            avg_score = _safe_float((average_scores.get(partner) or {}).get(theme, 0.0))
-            weighted_sum += avg_score * count
-            total_count += count
-        theme_average_reference[theme] = (weighted_sum / total_count) if total_count else 0.0
-
-    strengths: list[dict[str, Any]] = []
+    # One pass over the populated cells replaces the themes x partners probe
+    # loops; zero-count cells contribute nothing to either reference or totals.
+    theme_weighted_sums: dict[str, float] = {}
+    theme_totals: dict[str, int] = {}
+    for partner, partner_counts in counts.items():
+        partner_scores = average_scores.get(partner) or {}
+        for theme, count in partner_counts.items():
+            if count == 0:
+                continue
+            avg_score = partner_scores.get(theme, 0.0)
+            theme_weighted_sums[theme] = theme_weighted_sums.get(theme, 0.0) + avg_score * count
+            theme_totals[theme] = theme_totals.get(theme, 0) + count
+    theme_average_reference = {
+        theme: (theme_weighted_sums[theme] / total) if total else 0.0 for theme, total in theme_totals.items()
+    }
+
+    strengths: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
     for partner in partners:
         partner_counts = counts.get(partner) if isinstance(counts.get(partner), dict) else {}
         partner_scores = average_scores.get(partner) if isinstance(average_scores.get(partner), dict) else {}
-        partner_total = sum(int(value or 0) for value in partner_counts.values())
-        if partner_total == 0:
-            continue
+        partner_delta_counts = delta_counts.get(partner) or {}
+        partner_delta_scores = delta_scores.get(partner) or {}
 
+        # Totals, the weighted average, and the strong-theme list all come
+        # from one scan of this partner's populated cells.
+        partner_total = 0
         weighted_score_sum = 0.0
+        keyed_themes: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
         for theme, count in partner_counts.items():
-            weighted_score_sum += int(count or 0) * _safe_float(partner_scores.get(theme, 0.0))
-        partner_avg_score = weighted_score_sum / partner_total if partner_total else 0.0
-
-        strong_themes: list[dict[str, Any]] = []
-        for theme in themes:
-            count = int(partner_counts.get(theme, 0) or 0)
             if count == 0:
                 continue
-            avg_score = _safe_float(partner_scores.get(theme, 0.0))
-            theme_ref = theme_average_reference.get(theme, 0.0)
-            if avg_score < theme_ref:
+            avg_score = partner_scores.get(theme, 0.0)
+            partner_total += count
+            weighted_score_sum += count * avg_score
+            if avg_score < theme_average_reference.get(theme, 0.0):
                 continue
-            strong_themes.append(
-                {
-                    "theme": theme,
-                    "opportunity_count": count,
-                    "average_score": round(avg_score, 4),
-                    "delta_count": int((delta_counts.get(partner) or {}).get(theme, 0) or 0),
-                    "delta_average_score": round(_safe_float((delta_scores.get(partner) or {}).get(theme, 0.0)), 4),
-                }
+            # avg_score and the delta matrices are already rounded to 4 places
+            # upstream, so no per-cell re-rounding here.
+            keyed_themes.append(
+                (
+                    (-avg_score, -count, theme),
+                    {
+                        "theme": theme,
+                        "opportunity_count": count,
+                        "average_score": avg_score,
+                        "delta_count": partner_delta_counts.get(theme, 0),
+                        "delta_average_score": partner_delta_scores.get(theme, 0.0),
+                    },
+                )
             )
 
-        strong_themes.sort(
-            key=lambda item: (
-                -_safe_float(item.get("average_score")),
-                -int(item.get("opportunity_count") or 0),
-                str(item.get("theme") or ""),
-            )
-        )
+        if partner_total == 0:
+            continue
+        partner_avg_score = round(weighted_score_sum / partner_total, 4)
 
+        strong_themes = _sorted_rows(keyed_themes)
         strengths.append(
-            {
-                "partner": partner,
-                "total_opportunities": partner_total,
-                "average_score": round(partner_avg_score, 4),
-                "strong_themes": strong_themes,
-            }
+            (
+                (-len(strong_themes), -partner_avg_score, partner),
+                {
+                    "partner": partner,
+                    "total_opportunities": partner_total,
+                    "average_score": partner_avg_score,
+                    "strong_themes": strong_themes,
+                },
+            )
         )
 
-    strengths.sort(
-        key=lambda item: (
-            -len(item.get("strong_themes") if isinstance(item.get("strong_themes"), list) else []),
-            -_safe_float(item.get("average_score")),
-            str(item.get("partner") or ""),
-        )
-    )
-    return strengths
+    return _sorted_rows(strengths)
 
 
 def _build_theme_strengths(
@@ -298,56 +472,53 @@ def _build_theme_strengths(
     average_scores: dict[str, dict[str, float]],
     delta_counts: dict[str, dict[str, int]],
 ) -> list[dict[str, Any]]:
-    strengths: list[dict[str, Any]] = []
-
-    for theme in themes:
-        leaders: list[dict[str, Any]] = []
-        total_count = 0
-        weighted_sum = 0.0
-        for partner in partners:
-            count = int((counts.get(partner) or {}).get(theme, 0) or 0)
+    # Invert the loop nest: a single pass over each partner's populated cells
+    # buckets leaders per theme instead of probing every partner per theme.
+    theme_leaders: dict[str, list[tuple[tuple[Any, ...], dict[str, Any]]]] = {}
+    theme_totals: dict[str, int] = {}
+    theme_weighted_sums: dict[str, float] = {}
+    for partner in partners:
+        partner_counts = counts.get(partner) or {}
+        partner_scores = average_scores.get(partner) or {}
+        partner_delta_counts = delta_counts.get(partner) or {}
+        for theme, count in partner_counts.items():
             if count <= 0:
                 continue
-            avg_score = _safe_float((average_scores.get(partner) or {}).get(theme, 0.0))
-            total_count += count
-            weighted_sum += avg_score * count
-            leaders.append(
-                {
-                    "partner": partner,
-                    "opportunity_count": count,
-                    "average_score": round(avg_score, 4),
-                    "delta_count": int((delta_counts.get(partner) or {}).get(theme, 0) or 0),
-                }
+            avg_score = partner_scores.get(theme, 0.0)
+            theme_totals[theme] = theme_totals.get(theme, 0) + count
+            theme_weighted_sums[theme] = theme_weighted_sums.get(theme, 0.0) + avg_score * count
+            theme_leaders.setdefault(theme, []).append(
+                (
+                    (-avg_score, -count, partner),
+                    {
+                        "partner": partner,
+                        "opportunity_count": count,
+                        "average_score": avg_score,
+                        "delta_count": partner_delta_counts.get(theme, 0),
+                    },
+                )
             )
 
-        leaders.sort(
-            key=lambda item: (
-                -_safe_float(item.get("average_score")),
-                -int(item.get("opportunity_count") or 0),
-                str(item.get("partner") or ""),
-            )
-        )
-
+    strengths: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+    for theme in themes:
+        total_count = theme_totals.get(theme, 0)
         if total_count == 0:
             continue
 
+        theme_avg_score = round(theme_weighted_sums.get(theme, 0.0) / total_count, 4)
         strengths.append(
-            {
-                "theme": theme,
-                "total_opportunities": total_count,
-                "average_score": round((weighted_sum / total_count) if total_count else 0.0, 4),
-                "leading_partners": leaders[:5],
-            }
+            (
+                (-total_count, -theme_avg_score, theme),
+                {
+                    "theme": theme,
+                    "total_opportunities": total_count,
+                    "average_score": theme_avg_score,
+                    "leading_partners": _sorted_rows(theme_leaders.get(theme, []))[:5],
+                },
+            )
         )
 
-    strengths.sort(
-        key=lambda item: (
-            -int(item.get("total_opportunities") or 0),
-            -_safe_float(item.get("average_score")),
-            str(item.get("theme") or ""),
-        )
-    )
-    return strengths
+    return _sorted_rows(strengths)
 
 
 def _build_week_over_week_rows(
@@ -358,41 +529,45 @@ def _build_week_over_week_rows(
     current_scores: dict[str, dict[str, float]],
     previous_scores: dict[str, dict[str, float]],
 ) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
+    # The densified matrices are mostly zeros on sparse data, so collect the
+    # (partner, theme) cells with any activity first and only build rows for
+    # those instead of walking the full P x T grid.
+    active: set[tuple[str, str]] = set()
     for partner in partners:
-        for theme in themes:
-            current_count = int((current_counts.get(partner) or {}).get(theme, 0) or 0)
-            previous_count = int((previous_counts.get(partner) or {}).get(theme, 0) or 0)
-            current_avg = _safe_float((current_scores.get(partner) or {}).get(theme, 0.0))
-            previous_avg = _safe_float((previous_scores.get(partner) or {}).get(theme, 0.0))
-            delta_count = current_count - previous_count
-            delta_avg = round(current_avg - previous_avg, 4)
-
-            if current_count == 0 and previous_count == 0 and delta_avg == 0.0:
-                continue
+        for matrix in (current_counts, previous_counts, current_scores, previous_scores):
+            row = matrix.get(partner) or {}
+            for theme, value in row.items():
+                if value:
+                    active.add((partner, theme))
+
+    rows: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+    for partner, theme in active:
+        current_count = (current_counts.get(partner) or {}).get(theme, 0)
+        previous_count = (previous_counts.get(partner) or {}).get(theme, 0)
+        current_avg = (current_scores.get(partner) or {}).get(theme, 0.0)
+        previous_avg = (previous_scores.get(partner) or {}).get(theme, 0.0)
+        delta_count = current_count - previous_count
+        delta_avg = round(current_avg - previous_avg, 4)
+
+        if current_count == 0 and previous_count == 0 and delta_avg == 0.0:
+            continue
 
-            rows.append(
+        rows.append(
+            (
+                (-abs(delta_count), -abs(delta_avg), partner, theme),
                 {
                     "partner": partner,
                     "theme": theme,
                     "previous_count": previous_count,
                     "current_count": current_count,
                     "delta_count": delta_count,
-                    "previous_average_score": round(previous_avg, 4),
-                    "current_average_score": round(current_avg, 4),
+                    "previous_average_score": previous_avg,
+                    "current_average_score": current_avg,
                     "delta_average_score": delta_avg,
-                }
+                },
             )
-
-    rows.sort(
-        key=lambda item: (
-            -abs(int(item.get("delta_count") or 0)),
-            -abs(_safe_float(item.get("delta_average_score") or 0.0)),
-            str(item.get("partner") or ""),
-            str(item.get("theme") or ""),
         )
-    )
-    return rows
+    return _sorted_rows(rows)
 
 
 def build_comparative_data(analyses_dir: Path = Path("analyses")) -> dict[str, Any]:
@@ -416,10 +591,8 @@ def build_comparative_data(analyses_dir: Path = Path("analyses")) -> dict[str, A
     latest_record = run_records[-1]
     previous_record = run_records[-2] if len(run_records) >= 2 else None
 
-    latest_summary = _summarize_run(latest_record["analysis"], latest_record["run_id"])
-    previous_summary = (
-        _summarize_run(previous_record["analysis"], previous_record["run_id"]) if previous_record is not None else None
-    )
+    latest_summary = _record_summary(analyses_dir, latest_record)
+    previous_summary = _record_summary(analyses_dir, previous_record) if previous_record is not None else None
 
     latest_counts = latest_summary["counts"] if isinstance(latest_summary.get("counts"), dict) else {}
     latest_scores = latest_summary["average_scores"] if isinstance(latest_summary.get("average_scores"), dict) else {}
@@ -509,7 +682,16 @@ def build_comparative_data(analyses_dir: Path = Path("analyses")) -> dict[str, A
 
 def write_comparative_output(comparative_data: dict[str, Any], output_path: Path) -> Path:
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(comparative_data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(comparative_data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    else:
+        # Stream encoder chunks straight to the file instead of materializing
+        # the whole serialized document in memory first.
+        encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+        with output_path.open("w", encoding="utf-8", buffering=1 << 20) as handle:
+            for chunk in encoder.iterencode(comparative_data):
+                handle.write(chunk)
+            handle.write("\n")
     log(f"Wrote comparative analysis output to {output_path}")
     return output_path
 
@@ -524,28 +706,32 @@ def _build_delta_table(rows: list[dict[str, Any]]) -> str:
     if not rows:
         return "| Partner | Theme | Prev Count | Curr Count | Delta | Prev Avg | Curr Avg | Delta Avg |\n| --- | --- | ---: | ---: | ---: | ---: | ---: | ---: |\n| - | - | 0 | 0 | 0 | 0.00 | 0.00 | 0.00 |"
 
+    # Template hoisted out of the loop so each row only pays for formatting,
+    # not for rebuilding the literal 25 times.
+    row_template = (
+        "| {partner} | {theme} | {prev_count} | {curr_count} | {count_sign}{delta_count}"
+        " | {prev_avg:.2f} | {curr_avg:.2f} | {score_sign}{delta_score:.2f} |"
+    )
     lines = [
         "| Partner | Theme | Prev Count | Curr Count | Delta | Prev Avg | Curr Avg | Delta Avg |",
         "| --- | --- | ---: | ---: | ---: | ---: | ---: | ---: |",
     ]
+    # Rows come straight from _build_week_over_week_rows with ints and floats
+    # already in place, so no per-field re-coercion is needed here.
     for row in rows[:25]:
-        if not isinstance(row, dict):
-            continue
-        delta_count = int(row.get("delta_count") or 0)
-        delta_score = _safe_float(row.get("delta_average_score") or 0.0)
-        count_sign = "+" if delta_count > 0 else ""
-        score_sign = "+" if delta_score > 0 else ""
+        delta_count = row["delta_count"]
+        delta_score = row["delta_average_score"]
         lines.append(
-            "| {partner} | {theme} | {prev_count} | {curr_count} | {count_sign}{delta_count} | {prev_avg:.2f} | {curr_avg:.2f} | {score_sign}{delta_score:.2f} |".format(
-                partner=str(row.get("partner") or "-"),
-                theme=str(row.get("theme") or "-"),
-                prev_count=int(row.get("previous_count") or 0),
-                curr_count=int(row.get("current_count") or 0),
-                count_sign=count_sign,
+            row_template.format(
+                partner=row["partner"],
+                theme=row["theme"],
+                prev_count=row["previous_count"],
+                curr_count=row["current_count"],
+                count_sign="+" if delta_count > 0 else "",
                 delta_count=delta_count,
-                prev_avg=_safe_float(row.get("previous_average_score") or 0.0),
-                curr_avg=_safe_float(row.get("current_average_score") or 0.0),
-                score_sign=score_sign,
+                prev_avg=row["previous_average_score"],
+                curr_avg=row["current_average_score"],
+                score_sign="+" if delta_score > 0 else "",
                 delta_score=delta_score,
             )
         )
@@ -595,21 +781,27 @@ def _build_theme_dominance_summaries(theme_strengths: list[dict[str, Any]]) -> s
     return "\n".join(lines) if lines else "- No theme dominance insights available yet."
 
 
+def _list_markdown_names(directory: Path) -> list[str]:
+    """List *.md file names via one scandir pass (dirent data, no extra stats)."""
+    if not os.path.isdir(directory):
+        return []
+    with os.scandir(directory) as entries:
+        return sorted(
+            entry.name for entry in entries if entry.name.endswith(".md") and entry.is_file(follow_symlinks=False)
+        )
+
+
 def _build_partner_and_theme_links(docs_dir: Path) -> str:
     partner_links: list[str] = []
     theme_links: list[str] = []
 
-    partners_dir = docs_dir / "partners"
-    if partners_dir.exists():
-        for path in sorted(partners_dir.glob("*.md")):
-            label = path.stem.replace("-", " ").title()
-            partner_links.append(f"- [{label}](partners/{path.name})")
+    for name in _list_markdown_names(docs_dir / "partners"):
+        label = name[:-3].replace("-", " ").title()
+        partner_links.append(f"- [{label}](partners/{name})")
 
-    themes_dir = docs_dir / "themes"
-    if themes_dir.exists():
-        for path in sorted(themes_dir.glob("*.md")):
-            label = path.stem.replace("-", " ").title()
-            theme_links.append(f"- [{label}](themes/{path.name})")
+    for name in _list_markdown_names(docs_dir / "themes"):
+        label = name[:-3].replace("-", " ").title()
+        theme_links.append(f"- [{label}](themes/{name})")
 
     partner_section = "\n".join(partner_links[:20]) if partner_links else "- No partner pages available yet."
     theme_section = "\n".join(theme_links[:20]) if theme_links else "- No theme pages available yet."
@@ -691,6 +883,30 @@ def render_comparative_markdown(
     return output_path
 
 
+def _inputs_fingerprint(analyses_dir: Path, extra_paths: list[Path]) -> str:
+    """Digest the (path, mtime, size) of every input file feeding the outputs."""
+    stats: list[str] = []
+    for pattern in ("analysis-*.json", "weekly-*.json"):
+        for file_path in analyses_dir.glob(pattern):
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            stats.append(f"{file_path}:{stat.st_mtime_ns}:{stat.st_size}")
+    for file_path in extra_paths:
+        try:
+            stat = file_path.stat()
+        except OSError:
+            continue
+        stats.append(f"{file_path}:{stat.st_mtime_ns}:{stat.st_size}")
+    stats.sort()
+    return hashlib.blake2b("\n".join(stats).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _fingerprint_path(output_path: Path) -> Path:
+    return output_path.parent / f".{output_path.stem}.fingerprint"
+
+
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Build cross-partner x cross-theme comparative analytics")
     parser.add_argument("--analyses-dir", default="analyses", help="Directory containing analysis JSON files")
@@ -703,8 +919,22 @@ def _parse_args() -> argparse.Namespace:
 
 def main() -> None:
     args = _parse_args()
+    output_path = Path(args.output)
+
+    # No-change runs skip the whole pipeline: if every input file's
+    # (path, mtime, size) matches the fingerprint recorded alongside the
+    # previous output and the outputs still exist, there is nothing to redo.
+    extra_inputs = [Path(args.charts_markdown)] if args.charts_markdown else []
+    fingerprint = _inputs_fingerprint(Path(args.analyses_dir), extra_inputs)
+    fingerprint_path = _fingerprint_path(output_path)
+    outputs_present = output_path.exists() and (not args.markdown_output or Path(args.markdown_output).exists())
+    if outputs_present and fingerprint_path.exists():
+        if fingerprint_path.read_text(encoding="utf-8").strip() == fingerprint:
+            log(f"Comparative inputs unchanged; keeping existing {output_path}")
+            return
+
     comparative_data = build_comparative_data(analyses_dir=Path(args.analyses_dir))
-    write_comparative_output(comparative_data, output_path=Path(args.output))
+    write_comparative_output(comparative_data, output_path=output_path)
 
     if args.markdown_output:
         chart_markdown = _load_chart_markdown(Path(args.charts_markdown)) if args.charts_markdown else ""
@@ -715,6 +945,8 @@ def main() -> None:
             charts_markdown=chart_markdown,
         )
 
+    fingerprint_path.write_text(fingerprint + "\n", encoding="utf-8")
+
 
 if __name__ == "__main__":
     main()
@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 """Centralized configuration loader for the weekly analysis pipeline.
 
+This module is the single owner of pipeline env-var reads; every script
+imports load_config/load_insights_config from here rather than reading
+os.environ itself.
+
 Suggested commit message:
 feat: add centralized pipeline config loader and integrate across scripts
 """
@@ -8,7 +12,13 @@ feat: add centralized pipeline config loader and integrate across scripts
 from __future__ import annotations
 
 import os
-from typing import Any
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
+
+
+# Hoisted so _as_bool does not rebuild the truthy-token set on every call.
+_TRUE: frozenset[str] = frozenset({"1", "true", "yes", "on"})
 
 
 def _as_bool(value: str | bool | None, default: bool) -> bool:
@@ -16,97 +26,249 @@ def _as_bool(value: str | bool | None, default: bool) -> bool:
         return default
     if isinstance(value, bool):
         return value
-    return str(value).strip().lower() in {"1", "true", "yes", "on"}
+    return str(value).strip().lower() in _TRUE
 
 
 def _as_int(value: str | int | None, default: int) -> int:
-    if value is None:
+    # int() already tolerates surrounding whitespace, so no stripped copy.
+    if value is None or value == "":
         return default
     if isinstance(value, int):
         return value
-    return int(str(value).strip())
+    return int(value)
 
 
 def _as_float(value: str | float | int | None, default: float) -> float:
-    if value is None:
+    if value is None or value == "":
         return default
     if isinstance(value, (float, int)):
         return float(value)
-    return float(str(value).strip())
-
-
-def load_config(overrides: dict[str, Any] | None = None) -> dict[str, Any]:
-    cfg: dict[str, Any] = {
-        "spreadsheet_id": os.environ.get("SPREADSHEET_ID") or "",
-        "range": os.environ.get("SHEET_RANGE") or "Sheet1!A1:J50",
-        "service_account_path": os.environ.get("SERVICE_ACCOUNT_PATH") or "/tmp/gservice.json",
-        "provider": os.environ.get("AI_PROVIDER") or "openai",
-        "api_key": os.environ.get("AI_API_KEY") or "",
-        "model": os.environ.get("AI_MODEL") or "gpt-4o-mini",
-        "followup_model": os.environ.get("FOLLOWUP_MODEL") or os.environ.get("AI_MODEL") or "gpt-4.1-mini",
-        "output_dir": os.environ.get("OUTPUT_DIR") or "analyses",
-        "allow_mock": _as_bool(os.environ.get("ALLOW_MOCK"), True),
-        "timeout_seconds": _as_int(os.environ.get("AI_TIMEOUT_SECONDS"), 60),
-        "slack_webhook_url": os.environ.get("SLACK_WEBHOOK_URL") or "",
-        "email_enabled": _as_bool(os.environ.get("EMAIL_ENABLED"), False),
-        "email_smtp_host": os.environ.get("EMAIL_SMTP_HOST") or "",
-        "email_smtp_port": _as_int(os.environ.get("EMAIL_SMTP_PORT"), 587),
-        "email_username": os.environ.get("EMAIL_USERNAME") or "",
-        "email_password": os.environ.get("EMAIL_PASSWORD") or "",
-        "email_to": os.environ.get("EMAIL_TO") or "",
-        "chain_max_depth": _as_int(os.environ.get("CHAIN_MAX_DEPTH"), 2),
-        "chain_max_branches": _as_int(os.environ.get("CHAIN_MAX_BRANCHES"), 2),
-        "chain_timeout_sec": _as_int(os.environ.get("CHAIN_TIMEOUT_SEC"), 45),
-        "chain_min_confidence_delta": _as_float(os.environ.get("CHAIN_MIN_CONFIDENCE_DELTA"), 0.08),
-        "chain_budget_usd": _as_float(os.environ.get("CHAIN_BUDGET_USD"), 0.5),
+    return float(value)
+
+
+# Fixed config schema: (cfg key, env var, kind, default). The env-reading
+# function is generated from this once at import, so each call runs one
+# straight-line dict literal with no per-field dispatch.
+_SCHEMA: tuple[tuple[str, str, str, Any], ...] = (
+    ("spreadsheet_id", "SPREADSHEET_ID", "str", ""),
+    ("range", "SHEET_RANGE", "str", "Sheet1!A1:J50"),
+    ("service_account_path", "SERVICE_ACCOUNT_PATH", "str", "/tmp/gservice.json"),
+    ("provider", "AI_PROVIDER", "str", "openai"),
+    ("api_key", "AI_API_KEY", "str", ""),
+    ("model", "AI_MODEL", "str", "gpt-4o-mini"),
+    ("followup_model", "FOLLOWUP_MODEL", "followup", "gpt-4.1-mini"),
+    ("output_dir", "OUTPUT_DIR", "str", "analyses"),
+    ("allow_mock", "ALLOW_MOCK", "bool", True),
+    ("timeout_seconds", "AI_TIMEOUT_SECONDS", "int", 60),
+    ("slack_webhook_url", "SLACK_WEBHOOK_URL", "str", ""),
+    ("email_enabled", "EMAIL_ENABLED", "bool", False),
+    ("email_smtp_host", "EMAIL_SMTP_HOST", "str", ""),
+    ("email_smtp_port", "EMAIL_SMTP_PORT", "int", 587),
+    ("email_username", "EMAIL_USERNAME", "str", ""),
+    ("email_password", "EMAIL_PASSWORD", "str", ""),
+    ("email_to", "EMAIL_TO", "str", ""),
+    ("chain_max_depth", "CHAIN_MAX_DEPTH", "int", 2),
+    ("chain_max_branches", "CHAIN_MAX_BRANCHES", "int", 2),
+    ("chain_timeout_sec", "CHAIN_TIMEOUT_SEC", "int", 45),
+    ("chain_min_confidence_delta", "CHAIN_MIN_CONFIDENCE_DELTA", "float", 0.08),
+    ("chain_budget_usd", "CHAIN_BUDGET_USD", "float", 0.5),
+)
+
+
+# Hard defaults built once; each call copies this dict and overlays only the
+# env vars that are actually set, so a sparse environment touches few keys.
+_DEFAULTS: dict[str, Any] = {key: default for key, _, _, default in _SCHEMA}
+
+# Bytes-level env mapping (Linux/macOS); numeric fields parse the raw bytes
+# directly with int()/float(), skipping the str decode os.environ would do.
+_ENVB = getattr(os, "environb", None)
+
+
+def _emit_env_reader() -> str:
+    lines = ["def _read_env_config(env, envb):", "    cfg = dict(_DEFAULTS)"]
+    for key, env_key, kind, default in _SCHEMA:
+        # Dispatch on the field kind happens once here at import; the emitted
+        # function itself is straight-line with the coercion already inlined.
+        match kind:
+            case "str":
+                lines.append(f"    v = env({env_key!r})")
+                lines.append(f"    if v: cfg[{key!r}] = v")
+            case "followup":
+                lines.append(f"    v = env({env_key!r}) or env('AI_MODEL')")
+                lines.append(f"    if v: cfg[{key!r}] = v")
+            case "bool":
+                lines.append(f"    v = env({env_key!r})")
+                lines.append(f"    if v is not None: cfg[{key!r}] = _as_bool(v, {default!r})")
+            case "int" | "float":
+                if _ENVB is not None:
+                    lines.append(f"    v = envb({env_key.encode()!r})")
+                else:
+                    lines.append(f"    v = env({env_key!r})")
+                lines.append(f"    if v: cfg[{key!r}] = {kind}(v)")
+            case _:
+                raise ValueError(f"Unknown config field kind: {kind}")
+    lines.append("    return cfg")
+    return "\n".join(lines)
+
+
+_reader_namespace: dict[str, Any] = {
+    "_DEFAULTS": _DEFAULTS,
+    "_as_bool": _as_bool,
+    "_as_int": _as_int,
+    "_as_float": _as_float,
+}
+exec(compile(_emit_env_reader(), "<config schema>", "exec"), _reader_namespace)
+_read_env_config = _reader_namespace["_read_env_config"]
+
+_KIND_COERCERS = {"bool": _as_bool, "int": _as_int, "float": _as_float}
+
+# Typed keys and their defaults, used to coerce override values; everything
+# read from the environment is coerced once at read time.
+_OVERRIDE_COERCERS: dict[str, tuple[Any, Any]] = {
+    key: (_KIND_COERCERS[kind], default) for key, _, kind, default in _SCHEMA if kind in _KIND_COERCERS
+}
+_OVERRIDE_COERCERS.update(
+    {
+        "insight_min_count": (_as_int, 3),
+        "insight_delta_threshold": (_as_float, 2.0),
+        "insight_concentration_threshold": (_as_float, 0.6),
+        "insight_anomaly_multiplier": (_as_float, 2.0),
     }
+)
+
+
+# Canonical provider names; values already in canonical form bypass the
+# strip/lower normalization in _build_config.
+_PROVIDERS = {"openai": "openai", "mock": "mock"}
+
+
+# Every env var read by _build_config; the tuple of their current values is
+# the memoization key, so any change to a relevant variable misses the cache.
+# Numeric keys are fingerprinted as raw bytes so they skip str decoding too.
+_CONFIG_ENV_KEYS = tuple(dict.fromkeys(env_key for _, env_key, _, _ in _SCHEMA))
+_NUMERIC_ENV_KEYS = frozenset(env_key for _, env_key, kind, _ in _SCHEMA if kind in ("int", "float"))
+_FINGERPRINT_SPEC = tuple(
+    (key, key.encode() if _ENVB is not None and key in _NUMERIC_ENV_KEYS else None)
+    for key in _CONFIG_ENV_KEYS
+)
+
 
+def _env_fingerprint() -> tuple[str | bytes | None, ...]:
+    env = os.environ.get
+    envb = _ENVB.get if _ENVB is not None else None
+    return tuple(env(key) if bkey is None else envb(bkey) for key, bkey in _FINGERPRINT_SPEC)
+
+
+def load_config(overrides: dict[str, Any] | None = None) -> Mapping[str, Any]:
+    # Parsing and validation both live in _build_config, so a cache hit skips
+    # the whole body - including the required-key checks, which were already
+    # enforced when this exact (env, overrides) snapshot was first built.
+    # Failed builds are never cached, so invalid snapshots re-raise each call.
+    override_items = tuple(sorted(overrides.items())) if overrides else ()
+    fingerprint = _env_fingerprint()
+    try:
+        cached = _build_config(fingerprint, override_items)
+    except TypeError:
+        # Unhashable override value: build uncached.
+        cached = _build_config.__wrapped__(fingerprint, override_items)
+    # Read-only view over the cached dict: no per-call copy, and call sites
+    # cannot mutate the cache. Callers that need a writable dict do dict(cfg).
+    return MappingProxyType(cached)
+
+
+@lru_cache(maxsize=8)
+def _build_config(
+    env_values: tuple[str | None, ...], override_items: tuple[tuple[str, Any], ...]
+) -> dict[str, Any]:
+    overrides = dict(override_items)
+    # One bound method instead of ~20 os.environ attribute resolutions.
+    cfg: dict[str, Any] = _read_env_config(os.environ.get, _ENVB.get if _ENVB is not None else None)
+
+    # Env-sourced values above are already typed, so coercion applies only to
+    # the keys an override actually replaced.
     if overrides:
         for key, value in overrides.items():
-            if value is not None:
-                cfg[key] = value
+            if value is None:
+                continue
+            coercer = _OVERRIDE_COERCERS.get(key)
+            cfg[key] = coercer[0](value, coercer[1]) if coercer else value
 
-    provider = str(cfg.get("provider", "openai")).strip().lower()
+    # Every key is guaranteed present by the defaults overlay, so the tail
+    # binds each value once with direct indexing instead of repeated .get probes.
+    raw_provider = cfg["provider"] or "openai"
+    # Known providers skip the strip/lower allocations entirely.
+    provider = _PROVIDERS.get(raw_provider) or str(raw_provider).strip().lower()
     cfg["provider"] = provider
 
-    if not cfg.get("spreadsheet_id"):
+    if not cfg["spreadsheet_id"]:
         raise ValueError("Missing required configuration: SPREADSHEET_ID")
 
-    api_key = str(cfg.get("api_key") or "").strip()
-    allow_mock = _as_bool(cfg.get("allow_mock"), True)
+    api_key = str(cfg["api_key"] or "").strip()
+    allow_mock = cfg["allow_mock"]
     if provider != "mock" and not api_key:
         raise ValueError("Missing required configuration: AI_API_KEY")
     if provider == "mock" and not allow_mock:
         raise ValueError("Mock provider is disabled by configuration")
 
-    cfg["allow_mock"] = allow_mock
-    cfg["timeout_seconds"] = _as_int(cfg.get("timeout_seconds"), 60)
     cfg["api_key"] = api_key
-    cfg["followup_model"] = str(cfg.get("followup_model") or cfg.get("model") or "gpt-4.1-mini")
-    cfg["chain_max_depth"] = _as_int(cfg.get("chain_max_depth"), 2)
-    cfg["chain_max_branches"] = _as_int(cfg.get("chain_max_branches"), 2)
-    cfg["chain_timeout_sec"] = _as_int(cfg.get("chain_timeout_sec"), 45)
-    cfg["chain_min_confidence_delta"] = _as_float(cfg.get("chain_min_confidence_delta"), 0.08)
-    cfg["chain_budget_usd"] = _as_float(cfg.get("chain_budget_usd"), 0.5)
+    followup_model = cfg["followup_model"]
+    cfg["followup_model"] = str(followup_model or cfg["model"] or "gpt-4.1-mini")
     return cfg
 
 
-def load_insights_config(overrides: dict[str, Any] | None = None) -> dict[str, Any]:
-    cfg: dict[str, Any] = {
-        "insight_min_count": _as_int(os.environ.get("INSIGHT_MIN_COUNT"), 3),
-        "insight_delta_threshold": _as_float(os.environ.get("INSIGHT_DELTA_THRESHOLD"), 2.0),
-        "insight_concentration_threshold": _as_float(os.environ.get("INSIGHT_CONCENTRATION_THRESHOLD"), 0.6),
-        "insight_anomaly_multiplier": _as_float(os.environ.get("INSIGHT_ANOMALY_MULTIPLIER"), 2.0),
-        "insight_template_path": os.environ.get("INSIGHT_TEMPLATE_PATH") or "scripts/templates/insight_templates.yml",
-    }
+_INSIGHT_FIELDS = (
+    "insight_min_count",
+    "insight_delta_threshold",
+    "insight_concentration_threshold",
+    "insight_anomaly_multiplier",
+    "insight_template_path",
+)
+
+
+class InsightsConfig:
+    """Insight thresholds parsed lazily: each field reads its env var on first access."""
+
+    def __init__(self, overrides: dict[str, Any] | None = None) -> None:
+        self._overrides = overrides or {}
 
+    def _field(self, key: str, env_key: str, coercer: Any, default: Any) -> Any:
+        value = self._overrides.get(key)
+        if value is None:
+            value = os.environ.get(env_key)
+        return coercer(value, default)
+
+    @cached_property
+    def insight_min_count(self) -> int:
+        return self._field("insight_min_count", "INSIGHT_MIN_COUNT", _as_int, 3)
+
+    @cached_property
+    def insight_delta_threshold(self) -> float:
+        return self._field("insight_delta_threshold", "INSIGHT_DELTA_THRESHOLD", _as_float, 2.0)
+
+    @cached_property
+    def insight_concentration_threshold(self) -> float:
+        return self._field("insight_concentration_threshold", "INSIGHT_CONCENTRATION_THRESHOLD", _as_float, 0.6)
+
+    @cached_property
+    def insight_anomaly_multiplier(self) -> float:
+        return self._field("insight_anomaly_multiplier", "INSIGHT_ANOMALY_MULTIPLIER", _as_float, 2.0)
+
+    @cached_property
+    def insight_template_path(self) -> str:
+        override = self._overrides.get("insight_template_path")
+        if override is not None:
+            return str(override)
+        return os.environ.get("INSIGHT_TEMPLATE_PATH") or "scripts/templates/insight_templates.yml"
+
+    def as_dict(self) -> dict[str, Any]:
+        return {field: getattr(self, field) for field in _INSIGHT_FIELDS}
+
+
+def load_insights_config(overrides: dict[str, Any] | None = None) -> dict[str, Any]:
+    cfg = InsightsConfig(overrides).as_dict()
     if overrides:
+        # Unknown override keys pass through, as before.
         for key, value in overrides.items():
-            if value is not None:
+            if value is not None and key not in cfg:
                 cfg[key] = value
-
-    cfg["insight_min_count"] = _as_int(cfg.get("insight_min_count"), 3)
-    cfg["insight_delta_threshold"] = _as_float(cfg.get("insight_delta_threshold"), 2.0)
-    cfg["insight_concentration_threshold"] = _as_float(cfg.get("insight_concentration_threshold"), 0.6)
-    cfg["insight_anomaly_multiplier"] = _as_float(cfg.get("insight_anomaly_multiplier"), 2.0)
     return cfg
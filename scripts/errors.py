@@ -9,9 +9,15 @@ from __future__ import annotations
 
 import datetime as dt
 import json
+import os
 from functools import wraps
 from typing import Any, Callable, TypeVar
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from log_utils import log_error
 
 
@@ -35,8 +41,16 @@ def handle_exception(e: Exception, context: str) -> None:
         "context": context,
         "timestamp_utc": _timestamp_utc(),
     }
-    with open("pipeline_error.json", "w", encoding="utf-8") as fh:
-        json.dump(payload, fh, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+    # One C-level encode and one raw write instead of the TextIOWrapper path.
+    fd = os.open("pipeline_error.json", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
 
     raise SystemExit(1)
 
@@ -45,13 +59,17 @@ F = TypeVar("F", bound=Callable[..., Any])
 
 
 def safe_run(fn: F) -> F:
+    # Bound once at decoration time, so the except branches skip the
+    # attribute lookup on fn.
+    context = fn.__name__
+
     @wraps(fn)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
         try:
             return fn(*args, **kwargs)
         except PipelineError as exc:
-            handle_exception(exc, context=fn.__name__)
+            handle_exception(exc, context=context)
         except Exception as exc:
-            handle_exception(PipelineError("Unexpected pipeline failure"), context=fn.__name__)
+            handle_exception(PipelineError("Unexpected pipeline failure"), context=context)
 
     return wrapper  # type: ignore[return-value]
@@ -536,7 +536,8 @@ def _load_runtime_config(run_id: str, output_dir: str, templates_path: str) -> d
         "chain_template_path": templates_path,
     }
     try:
-        cfg = load_config(overrides)
+        # load_config returns a read-only mapping; copy before the writes below.
+        cfg = dict(load_config(overrides))
     except Exception:
         cfg = {
             "provider": os.environ.get("AI_PROVIDER") or "openai",
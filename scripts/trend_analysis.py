@@ -5,18 +5,41 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from log_utils import log
 
 
+@lru_cache(maxsize=256)
+def _load_json_cached(path_str: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    data = Path(path_str).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def _load_json(path: Path) -> dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    stat = path.stat()
+    return _load_json_cached(str(path), stat.st_mtime_ns, stat.st_size)
 
 
 def _safe_float(value: Any) -> float:
+    # Exact-type checks cover the overwhelmingly common JSON number cases
+    # without the try/except machinery (or an isinstance MRO walk).
+    if type(value) is float:
+        return value
+    if type(value) is int:
+        return float(value)
     try:
         return float(value)
     except (TypeError, ValueError):
@@ -126,19 +149,38 @@ def _extract_opportunities(payload: dict[str, Any]) -> list[dict[str, Any]]:
     return []
 
 
+def _load_payload(path_str: str) -> tuple[dict[str, Any] | None, str]:
+    """Parse one analysis file, returning (payload, error) so pool workers never raise."""
+    try:
+        return _load_json(Path(path_str)), ""
+    except Exception as exc:
+        return None, str(exc)
+
+
+# Below this many files, process startup costs more than serial parsing saves.
+_PARALLEL_LOAD_THRESHOLD = 4
+
+
 def load_analysis_runs(analyses_dir: Path = Path("analyses")) -> list[dict[str, Any]]:
     files = list(analyses_dir.glob("analysis-*.json")) + list(analyses_dir.glob("weekly-*.json"))
     seen_paths: set[Path] = set()
-    records: list[dict[str, Any]] = []
-
+    unique_files: list[Path] = []
     for file_path in files:
         if file_path in seen_paths:
             continue
         seen_paths.add(file_path)
-        try:
-            payload = _load_json(file_path)
-        except Exception as exc:
-            log(f"Skipping unreadable analysis file {file_path}: {exc}")
+        unique_files.append(file_path)
+
+    if len(unique_files) >= _PARALLEL_LOAD_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            payloads = list(executor.map(_load_payload, [str(path) for path in unique_files], chunksize=4))
+    else:
+        payloads = [_load_payload(str(path)) for path in unique_files]
+
+    records: list[dict[str, Any]] = []
+    for file_path, (payload, error) in zip(unique_files, payloads):
+        if payload is None:
+            log(f"Skipping unreadable analysis file {file_path}: {error}")
             continue
 
         records.append(
@@ -154,7 +196,40 @@ def load_analysis_runs(analyses_dir: Path = Path("analyses")) -> list[dict[str,
     return records
 
 
+# In-process memo keyed by a snapshot of the analysis files, so repeated
+# build_trend_data calls (insights plus the dashboard renderer in the same
+# run) parse and aggregate the corpus once. Callers treat the result as
+# read-only, matching how the JSON-loaded variant is used.
+_TREND_MEMO: dict[str, tuple[tuple[tuple[str, int, int], ...], dict[str, Any]]] = {}
+
+
+def _analyses_snapshot(analyses_dir: Path) -> tuple[tuple[str, int, int], ...]:
+    entries: list[tuple[str, int, int]] = []
+    try:
+        with os.scandir(analyses_dir) as it:
+            for entry in it:
+                name = entry.name
+                if name.endswith(".json") and (name.startswith("analysis-") or name.startswith("weekly-")):
+                    stat = entry.stat()
+                    entries.append((name, stat.st_mtime_ns, stat.st_size))
+    except FileNotFoundError:
+        return ()
+    entries.sort()
+    return tuple(entries)
+
+
 def build_trend_data(analyses_dir: Path = Path("analyses")) -> dict[str, Any]:
+    key = os.fspath(analyses_dir)
+    snapshot = _analyses_snapshot(analyses_dir)
+    cached = _TREND_MEMO.get(key)
+    if cached is not None and cached[0] == snapshot:
+        return cached[1]
+    trend_data = _compute_trend_data(analyses_dir)
+    _TREND_MEMO[key] = (snapshot, trend_data)
+    return trend_data
+
+
+def _compute_trend_data(analyses_dir: Path) -> dict[str, Any]:
     run_records = load_analysis_runs(analyses_dir=analyses_dir)
 
     runs: list[dict[str, Any]] = []